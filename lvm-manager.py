@@ -1,12 +1,23 @@
 import os
+import re
+import json
 import sys
+import functools
+import collections
+import select
+import shlex
 import subprocess
+import threading
+import time
 from PyQt6.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QListWidget, QLabel,
-    QLineEdit, QPushButton, QComboBox, QMessageBox, QProgressBar, QDialog,
-    QMenu, QTextEdit, QTableWidget, QTableWidgetItem
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QListWidget, QListWidgetItem,
+    QLabel, QLineEdit, QPushButton, QComboBox, QMessageBox, QProgressBar, QDialog,
+    QMenu, QTextEdit, QTableView
+)
+from PyQt6.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThread, QThreadPool,
+    QTimer, pyqtSignal, pyqtSlot
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QFont
 
 def relaunch_with_pkexec():
@@ -25,75 +36,180 @@ def relaunch_with_pkexec():
 
 relaunch_with_pkexec()
 
+_VER_RE = re.compile(r'\d+')
+
+
+@functools.lru_cache(maxsize=None)
 def parse_version(version_str):
     """
     Parse version string like '2.03.30(2)' to a tuple of integers (2, 3, 30)
     """
-    ver = version_str.split('(')[0]  # remove parentheses and after
-    parts = ver.strip().split('.')
-    parsed = []
-    for p in parts:
-        try:
-            parsed.append(int(p))
-        except:
-            # In case of weird format, extract digits only
-            digits = ''.join(filter(str.isdigit, p))
-            parsed.append(int(digits) if digits else 0)
-    return tuple(parsed)
+    # Ignore the parentheses and after, then take every run of digits
+    return tuple(int(x) for x in _VER_RE.findall(version_str.split('(', 1)[0]))
 
 
+@functools.lru_cache(maxsize=None)
 def check_lvm_version():
     """
     Run 'lvm version' command and parse the LVM version string.
+    The result is cached, the command runs only once per process.
     Returns a tuple like (2, 3, 30) or None on failure.
     """
-    result = subprocess.run(["lvm", "version"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    result = subprocess.run(["lvm", "version"], **_SP)
     if result.returncode != 0:
         return None
-    for line in result.stdout.splitlines():
+    for line in result.stdout.decode("ascii", "replace").splitlines():
+        line = line.strip()
         if line.startswith("LVM version:"):
-            version_part = line.split(':', 1)[1].strip().split()[0]
+            version_part = line.split(':', 1)[1].split(None, 1)[0]
             return parse_version(version_part)
     return None
 
-class DetailsTableDialog(QDialog):
-    def __init__(self, title, raw_csv, parent=None):
+MIB = 1024 * 1024
+
+def percent_hundredths(value):
+    """
+    Convert an LVM percentage like '12.34' to an integer number of hundredths (1234).
+    """
+    whole, _, frac = value.partition('.')
+    return int(whole) * 100 + int((frac + '00')[:2])
+
+# Minimal environment for all LVM commands instead of the full inherited one; the C
+# locale makes LVM print decimal dots. LVM_* settings (e.g. LVM_SYSTEM_DIR) are kept.
+_ENV = {
+    "PATH": "/sbin:/usr/sbin:/bin:/usr/bin",
+    "LC_ALL": "C",
+    **{k: v for k, v in os.environ.items() if k.startswith("LVM_")},
+}
+# Common keyword arguments for subprocess.run/Popen of LVM commands. Output is kept as
+# bytes: JSON reports are parsed from bytes and messages are decoded once where shown
+_SP = dict(stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=_ENV)
+
+
+def decode_msg(data):
+    """
+    Decode command output bytes for display.
+    """
+    return data.decode("utf-8", "replace").strip()
+
+
+def run_concurrently(*commands):
+    """
+    Start all commands at once and then wait for each of them, so the total
+    wall time is roughly that of the slowest command instead of their sum.
+    Returns a list of (returncode, stdout, stderr) in the order of commands, output as bytes.
+    """
+    procs = [
+        subprocess.Popen(cmd, **_SP)
+        for cmd in commands
+    ]
+    results = []
+    for proc in procs:
+        out, err = proc.communicate()
+        results.append((proc.returncode, out, err))
+    return results
+
+def run_with_timeout(cmd, timeout, grace=30):
+    """
+    Run cmd and stop it if it does not finish within timeout seconds.
+    It gets SIGTERM first, so LVM can resume suspended devices and clean up.
+    SIGKILL follows only if it is still running grace seconds later.
+    Returns (returncode, stdout, stderr) with output as bytes; returncode is None on timeout.
+    """
+    proc = subprocess.Popen(cmd, **_SP)
+    try:
+        out, err = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.terminate()
+        try:
+            proc.communicate(timeout=grace)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+        return None, b"", f"{cmd[0]} timed out after {timeout} seconds".encode()
+    return proc.returncode, out, err
+
+def _parse_report(out):
+    """
+    Parse a --reportformat json report straight from the output bytes, skipping
+    anything around it such as the command line echoed by the lvm shell.
+    Returns the parsed report or None if out holds no valid JSON.
+    """
+    start, end = out.find(b"{"), out.rfind(b"}")
+    if not 0 <= start < end:
+        return None
+    try:
+        return json.loads(out[start:end + 1])
+    except ValueError:
+        return None
+
+def _report_has_rows(report):
+    return any(rows for section in report.get("report", ()) for rows in section.values())
+
+# Column titles of DetailsTableDialog, one per LvmManager.DETAIL_FIELDS entry
+_DETAIL_HEADERS = ("LV", "Path", "LSize (GB)", "Attr", "Origin", "Data %", "Meta %", "CTime")
+
+
+@functools.lru_cache(maxsize=None)
+def _mono_font():
+    """
+    Shared monospace font, created on first use since QFont needs the QApplication.
+    """
+    return QFont("Monospace")
+
+class DetailsTableModel(QAbstractTableModel):
+    """
+    Read-only table model serving the parsed rows as they are,
+    without a QTableWidgetItem per cell.
+    """
+
+    def __init__(self, rows, headers, parent=None):
         super().__init__(parent)
-        self.setWindowTitle(title)
-        self.resize(900, 400)
+        self._rows = rows
+        self._headers = headers
 
-        layout = QVBoxLayout(self)
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
 
-        lines = raw_csv.strip().splitlines()
-        headers = ["LV", "Path", "LSize (GB)", "Attr", "Origin", "Data %", "Meta %", "CTime"]
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
 
-        self.table = QTableWidget(len(lines), len(headers))
-        self.table.setHorizontalHeaderLabels(headers)
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        return row[index.column()] if index.column() < len(row) else ""
 
-        def fix_parts(parts):
-            # LSize merging (columns 2 and 3)
-            if len(parts) >= 4:
-                parts[2] = parts[2] + ',' + parts[3]
-                del parts[3]
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return str(section + 1)
+
+    def flags(self, index):
+        return Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+
+    def to_text(self):
+        """
+        Table as tab-separated text, header line first.
+        """
+        cols = len(self._headers)
+        rows = ("\t".join((list(row) + [""] * cols)[:cols]) for row in self._rows)
+        return "\n".join(["\t".join(self._headers), *rows])
 
-            # Missing origin (4th column)
-            if len(parts) == 7:
-                parts.insert(4, '')
 
-            # Merging the rest after Meta % (i.e. from column 7 to the end) into one CTime column
-            if len(parts) > 8:
-                parts[7] = ' '.join(parts[7:])
-                del parts[8:]
+class DetailsTableDialog(QDialog):
+    def __init__(self, title, rows, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(title)
+        self.resize(900, 400)
 
-            return parts
+        layout = QVBoxLayout(self)
 
-        for row_i, line in enumerate(lines):
-            parts = line.split(",")
-            parts = fix_parts(parts)  # naprawiamy format
-            for col_i, val in enumerate(parts):
-                item = QTableWidgetItem(val.strip())
-                item.setFlags(item.flags() ^ Qt.ItemFlag.ItemIsEditable)
-                self.table.setItem(row_i, col_i, item)
+        self.model = DetailsTableModel(rows, _DETAIL_HEADERS, self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
 
         layout.addWidget(self.table)
 
@@ -104,98 +220,224 @@ class DetailsTableDialog(QDialog):
         btn_layout.addWidget(self.close_btn)
         layout.addLayout(btn_layout)
 
+        self._clipboard = QApplication.clipboard()
         self.copy_btn.clicked.connect(self.copy_to_clipboard)
         self.close_btn.clicked.connect(self.close)
 
     def copy_to_clipboard(self):
-        rows = []
-        headers = [self.table.horizontalHeaderItem(i).text() for i in range(self.table.columnCount())]
-        rows.append("\t".join(headers))
-        for r in range(self.table.rowCount()):
-            row_data = []
-            for c in range(self.table.columnCount()):
-                item = self.table.item(r, c)
-                row_data.append(item.text() if item else "")
-            rows.append("\t".join(row_data))
-        text = "\n".join(rows)
-        QApplication.clipboard().setText(text)
+        self._clipboard.setText(self.model.to_text())
+
+# One row of LvmManager.snapshot(); sizes in bytes, used is None for non-snapshots
+# and vg_free/vg_size are None if vgs failed
+LvInfo = collections.namedtuple("LvInfo", "is_snap used size vg_free vg_size")
+
+
+class LvmShell:
+    """
+    Long-lived interactive 'lvm' process. Report commands are written to its stdin
+    and their output is read back up to the next prompt, so repeated queries skip
+    the exec, config parsing and library setup of a fresh lvs/vgs process.
+    The shell gives no exit status, so it is only used for read-only reports.
+    """
+    PROMPT = b"lvm> "
+    TIMEOUT = 30.0
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._proc = None
+        self._closed = False
+
+    def run(self, argv):
+        """
+        Run argv (e.g. ["lvs", ...]) in the shell.
+        Returns (stdout, stderr) as bytes, or None if the shell is not usable.
+        Raises RuntimeError after close(), so a late call cannot start a new shell.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("lvm shell is closed")
+            try:
+                if self._proc is None:
+                    self._start()
+                self._proc.stdin.write((" ".join(shlex.quote(a) for a in argv) + "\n").encode())
+                self._proc.stdin.flush()
+                out, err = self._read_until_prompt()
+            except (OSError, TimeoutError) as e:
+                print(f"[LvmShell ERROR] {e}")
+                self._kill()
+                return None
+        return out, err
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            if self._proc is None:
+                return
+            try:
+                self._proc.stdin.write(b"exit\n")
+                self._proc.stdin.close()
+                self._proc.wait(timeout=2)
+            except (OSError, subprocess.TimeoutExpired):
+                self._kill()
+            self._proc = None
+
+    def _start(self):
+        # TERM=dumb keeps readline from adding escape sequences around the prompt
+        self._proc = subprocess.Popen(
+            ["lvm"], stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            env={**_ENV, "TERM": "dumb"}
+        )
+        self._read_until_prompt()
+
+    def _kill(self):
+        if self._proc is not None:
+            self._proc.kill()
+            self._proc.wait()
+            self._proc = None
+
+    def _read_until_prompt(self):
+        out, err = bytearray(), bytearray()
+        bufs = {self._proc.stdout.fileno(): out, self._proc.stderr.fileno(): err}
+        deadline = time.monotonic() + self.TIMEOUT
+        while not out.endswith(self.PROMPT):
+            ready, _, _ = select.select(list(bufs), [], [], max(deadline - time.monotonic(), 0))
+            if not ready:
+                raise TimeoutError("lvm shell did not answer in time")
+            for fd in ready:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    raise OSError("lvm shell exited")
+                bufs[fd] += chunk
+        # stderr written before the prompt may still be waiting in its pipe
+        fd = self._proc.stderr.fileno()
+        while select.select([fd], [], [], 0)[0]:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            err += chunk
+        return bytes(out[:-len(self.PROMPT)]), bytes(err)
+
 
 class LvmManager:
     """
     Encapsulates LVM command interactions.
     """
+    # Seconds for which the last lvs/vgs results are reused without asking LVM again
+    _ttl = 5.0
+    # Seconds after which a hanging lvcreate/lvremove is stopped; generous, since
+    # lvcreate -s keeps the origin suspended while it waits for udev
+    _op_timeout = 600
+    # Columns of get_detailed_lv_info, matching the DetailsTableDialog headers
+    DETAIL_FIELDS = ("lv_name", "lv_path", "lv_size", "lv_attr", "origin",
+                     "data_percent", "metadata_percent", "lv_time")
 
-    def list_logical_volumes(self):
+    def __init__(self):
+        # Last result of snapshot(), see there
+        self._snapshot = None
+        self._cache_ts = 0.0
+        self._shell = LvmShell()
+        # Only one LVM operation at a time, so a refresh cannot run during lvcreate/lvremove;
+        # is_stale(), the only call made from the GUI thread, does not take it
+        self._lock = threading.Lock()
+
+    def close(self):
+        self._shell.close()
+
+    def _run_reports(self, *commands):
         """
-        List all logical volumes with their volume group and whether they're snapshots.
-        Returns list of tuples: (vg_name, lv_name, is_snapshot)
+        Run report commands (lvs/vgs with --reportformat json) through the lvm shell,
+        falling back to separate concurrent processes if the shell is not available.
+        Returns a list of (report, stderr) in the order of commands, where report
+        is the parsed JSON output or None if the command failed.
         """
-        result = subprocess.run(
-            ["lvs", "--noheadings", "-o", "lv_name,vg_name,origin"],
-            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-        )
-        if result.returncode != 0:
-            raise RuntimeError(f"Error running lvs: {result.stderr.strip()}")
+        results = []
+        for cmd in commands:
+            res = self._shell.run(cmd)
+            if res is None:
+                return [
+                    (_parse_report(out) if returncode == 0 else None, decode_msg(err))
+                    for returncode, out, err in run_concurrently(*commands)
+                ]
+            out, err = res
+            report = _parse_report(out)
+            # The shell gives no exit status, but a failed report command still prints
+            # its (empty) report; only an empty report with errors counts as a failure
+            if report is not None and err.strip() and not _report_has_rows(report):
+                report = None
+            results.append((report, decode_msg(err)))
+        return results
+
+    def is_stale(self):
+        """
+        True when the cached LVM data is older than the TTL or was invalidated.
+        """
+        return time.monotonic() - self._cache_ts >= self._ttl
 
-        lvs = []
-        for line in result.stdout.strip().splitlines():
-            parts = line.strip().split()
-            lv_name = parts[0]
-            vg_name = parts[1]
-            origin = parts[2] if len(parts) > 2 else ""
-            is_snap = bool(origin)  # presence of origin means snapshot
-            lvs.append((vg_name, lv_name, is_snap))
-        return lvs
+    def _invalidate(self):
+        """
+        Drop cached LVM data after a mutation so the next query reloads it.
+        """
+        self._cache_ts = 0.0
 
-    def get_snapshot_info(self, vg_name, lv_name, is_snap):
+    def _rescan(self):
         """
-        Get snapshot size and used data percentage in MB.
-        Returns (used_mb, size_mb) or (None, None) if not a snapshot or error.
+        Make sure the next lvs/vgs sees our own change. Only lvmetad (LVM < 2.03)
+        cached metadata between commands; newer versions read it on every command.
         """
-        if not is_snap:
-            return None, None
-        result = subprocess.run(
-            ["lvs", "--noheadings", "-o", "lv_name,lv_size,data_percent",
-             "--units", "m", "--nosuffix", f"/dev/{vg_name}/{lv_name}"],
-            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-        )
-        if result.returncode != 0:
-            return None, None
-        for line in result.stdout.strip().splitlines():
-            parts = line.strip().split()
-            if len(parts) == 3 and parts[0] == lv_name:
-                try:
-                    size_mb = float(parts[1].replace(',', '.'))
-                    percent = float(parts[2].replace(',', '.').replace('%', ''))
-                    used_mb = size_mb * percent / 100.0
-                    return used_mb, size_mb
-                except Exception:
-                    return None, None
-        return None, None
-
-    def get_vg_free_space(self, vg_name):
-        """
-        Get free and total size in MB of the volume group.
-        Returns (free_mb, size_mb) or (None, None) on error.
-        """
-        result = subprocess.run(
-            ["vgs", "--noheadings", "-o", "vg_free,vg_size", "--units", "m", "--nosuffix", vg_name],
-            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-        )
-        if result.returncode != 0:
-            return None, None
-        line = result.stdout.strip()
-        if not line:
-            return None, None
-        parts = line.split()
-        if len(parts) != 2:
-            return None, None
-        try:
-            free_mb = float(parts[0].replace(',', '.'))
-            size_mb = float(parts[1].replace(',', '.'))
-            return free_mb, size_mb
-        except Exception:
-            return None, None
+        version = check_lvm_version()
+        if version is None or version >= (2, 3, 0):
+            return
+        subprocess.run(["vgscan", "--cache"], **_SP)
+
+    def _timed_out(self, err, name):
+        """
+        Handle an lvcreate/lvremove that had to be stopped: it may have got halfway,
+        so the cache is dropped and the returned message says the state is unknown.
+        """
+        self._rescan()
+        self._invalidate()
+        return (f"{decode_msg(err)}.\nThe state of {name} is unknown; "
+                f"check it with lvs before trying again.")
+
+    def snapshot(self):
+        """
+        Collect all logical volumes, their sizes and usage and the sizes of their
+        volume groups with one lvs and one vgs report.
+        Results are cached for _ttl seconds or until a snapshot is created or removed.
+        Returns dict (vg_name, lv_name) -> LvInfo, in lvs order.
+        """
+        with self._lock:
+            if self._snapshot is not None and not self.is_stale():
+                return dict(self._snapshot)
+
+            (lvs_report, lvs_err), (vgs_report, _) = self._run_reports(
+                ["lvs", "--reportformat", "json", "--units", "b", "--nosuffix",
+                 "-o", "lv_name,vg_name,origin,lv_size,data_percent"],
+                ["vgs", "--reportformat", "json", "--units", "b", "--nosuffix",
+                 "-o", "vg_name,vg_free,vg_size"],
+            )
+            if lvs_report is None:
+                raise RuntimeError(f"Error running lvs: {lvs_err or 'no valid report in its output'}")
+
+            vg_info = {}
+            if vgs_report is not None:
+                for vg in vgs_report["report"][0]["vg"]:
+                    vg_info[vg["vg_name"]] = (int(vg["vg_free"]), int(vg["vg_size"]))
+
+            snapshot = {}
+            for lv in lvs_report["report"][0]["lv"]:
+                vg_name, lv_name = lv["vg_name"], lv["lv_name"]
+                is_snap = bool(lv["origin"])  # presence of origin means snapshot
+                size_bytes = int(lv["lv_size"])
+                used_bytes = None
+                if is_snap and lv["data_percent"]:
+                    used_bytes = size_bytes * percent_hundredths(lv["data_percent"]) // 10000
+                vg_free, vg_size = vg_info.get(vg_name, (None, None))
+                snapshot[(vg_name, lv_name)] = LvInfo(is_snap, used_bytes, size_bytes, vg_free, vg_size)
+
+            self._snapshot = snapshot
+            self._cache_ts = time.monotonic()
+            return dict(snapshot)
 
     def create_snapshot(self, vg_name, lv_name, snap_name, size):
         """
@@ -203,85 +445,175 @@ class LvmManager:
         with specified size (e.g., '1G').
         Returns (success: bool, message: str).
         """
-        path = f"/dev/{vg_name}/{lv_name}"
-        result = subprocess.run(
-            ["lvcreate", "-L", size, "-s", "-n", snap_name, path],
-            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-        )
-        if result.returncode != 0:
-            return False, result.stderr.strip()
-        return True, result.stdout.strip()
+        with self._lock:
+            path = f"/dev/{vg_name}/{lv_name}"
+            returncode, out, err = run_with_timeout(
+                ["lvcreate", "-L", size, "-s", "-n", snap_name, path], self._op_timeout
+            )
+            if returncode is None:
+                return False, self._timed_out(err, f"{vg_name}/{snap_name}")
+            if returncode != 0:
+                return False, decode_msg(err)
+            self._rescan()
+            self._invalidate()
+            return True, decode_msg(out)
 
     def remove_snapshot(self, vg_name, snap_name):
         """
         Remove snapshot named snap_name from volume group vg_name.
         Returns (success: bool, message: str).
         """
-        path = f"/dev/{vg_name}/{snap_name}"
-        result = subprocess.run(
-            ["lvremove", "-f", path],
-            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-        )
-        if result.returncode != 0:
-            return False, result.stderr.strip()
-        return True, result.stdout.strip()
+        with self._lock:
+            path = f"/dev/{vg_name}/{snap_name}"
+            returncode, out, err = run_with_timeout(["lvremove", "-f", path], self._op_timeout)
+            if returncode is None:
+                return False, self._timed_out(err, f"{vg_name}/{snap_name}")
+            if returncode != 0:
+                return False, decode_msg(err)
+            self._rescan()
+            self._invalidate()
+            return True, decode_msg(out)
 
     def mount_snapshot(self, vg_name, snap_name, mount_point):
         """
         Mount the snapshot volume at mount_point.
         Returns (success: bool, message: str).
         """
-        device_path = f"/dev/{vg_name}/{snap_name}"
-        # Create mount point if doesn't exist
-        subprocess.run(["mkdir", "-p", mount_point])
-        # Mount command
-        result = subprocess.run(
-            ["mount", device_path, mount_point],
-            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-        )
-        if result.returncode != 0:
-            print(f"[mount_snapshot ERROR] stderr: {result.stderr.strip()}")
-            print(f"[mount_snapshot ERROR] stdout: {result.stdout.strip()}")
-            return False, result.stderr.strip()
-        print(f"[mount_snapshot SUCCESS] stdout: {result.stdout.strip()}")
-        return True, result.stdout.strip()
+        with self._lock:
+            device_path = f"/dev/{vg_name}/{snap_name}"
+            # Create mount point if doesn't exist
+            try:
+                os.makedirs(mount_point, exist_ok=True)
+            except OSError as e:
+                return False, str(e)
+            # Mount command
+            result = subprocess.run(["mount", device_path, mount_point], **_SP)
+            out, err = decode_msg(result.stdout), decode_msg(result.stderr)
+            if result.returncode != 0:
+                print(f"[mount_snapshot ERROR] stderr: {err}")
+                print(f"[mount_snapshot ERROR] stdout: {out}")
+                return False, err
+            print(f"[mount_snapshot SUCCESS] stdout: {out}")
+            return True, out
 
     def get_detailed_lv_info(self, vg_name, lv_name):
         """
-        Retrieves volume information in CSV format for easier parsing.
+        Retrieves volume information with one JSON lvs report.
+        Returns a list of rows (field strings in DETAIL_FIELDS order) or None on error.
         """
-        result = subprocess.run(
-            ["lvs", "-a", f"/dev/{vg_name}/{lv_name}",
-            "-o", "lv_name,lv_path,lv_size,attr,origin,data_percent,metadata_percent,lv_time",
-            "--units", "g", "--separator", ",", "--nosuffix", "--noheadings"],
-            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-        )
-        if result.returncode != 0:
+        with self._lock:
+            ((report, _),) = self._run_reports(
+                ["lvs", "-a", "--reportformat", "json", "--units", "g", "--nosuffix",
+                 "-o", ",".join(self.DETAIL_FIELDS), f"/dev/{vg_name}/{lv_name}"]
+            )
+        if report is None:
             return None
-        return result.stdout.strip()
+        rows = [[lv[field] for field in self.DETAIL_FIELDS] for lv in report["report"][0]["lv"]]
+        # A report without rows means the LV was not found
+        return rows or None
 
 
-class CommandThread(QThread):
+class LvmTaskSignals(QObject):
     """
-    QThread to run blocking subprocess commands in background.
+    Signals of LvmTask; QRunnable itself is not a QObject.
     """
     finished_signal = pyqtSignal(bool, str)
 
+
+class LvmTask(QRunnable):
+    """
+    Runs a blocking subprocess command on the global QThreadPool.
+    """
+
     def __init__(self, func, *args, **kwargs):
         super().__init__()
         self.func = func
         self.args = args
         self.kwargs = kwargs
+        self.signals = LvmTaskSignals()
 
     def run(self):
         try:
             success, msg = self.func(*self.args, **self.kwargs)
             if not success:
-                print(f"[CommandThread ERROR] {msg}")
+                print(f"[LvmTask ERROR] {msg}")
         except Exception as e:
-            print(f"[CommandThread EXCEPTION] {e}")
+            print(f"[LvmTask EXCEPTION] {e}")
             success, msg = False, str(e)
-        self.finished_signal.emit(success, msg)
+        self.signals.finished_signal.emit(success, msg)
+
+
+class LvmWorker(QObject):
+    """
+    Runs LvmManager calls on a long-lived background QThread so that lvs/vgs/
+    lvcreate/lvremove never block the GUI event loop.
+    Results are sent back to the GUI thread through signals.
+    """
+    lvs_ready = pyqtSignal(dict)
+    lvs_failed = pyqtSignal(str)
+    usage_reloaded = pyqtSignal(dict)
+    version_ready = pyqtSignal(object)
+    details_ready = pyqtSignal(str, str, object)
+    op_done = pyqtSignal(bool, str)
+
+    def __init__(self, lvm):
+        super().__init__()
+        self.lvm = lvm
+
+    @pyqtSlot()
+    def list_lvs(self):
+        try:
+            snapshot = self.lvm.snapshot()
+        except Exception as e:
+            self.lvs_failed.emit(str(e))
+            return
+        self.lvs_ready.emit(snapshot)
+
+    @pyqtSlot()
+    def check_version(self):
+        self.version_ready.emit(check_lvm_version())
+
+    @pyqtSlot()
+    def reload(self):
+        """
+        Reload cached LV/VG usage without touching the displayed LV list.
+        """
+        try:
+            snapshot = self.lvm.snapshot()
+        except Exception as e:
+            print(f"[LvmWorker EXCEPTION] {e}")
+            return
+        self.usage_reloaded.emit(snapshot)
+
+    @pyqtSlot(str, str)
+    def details(self, vg_name, lv_name):
+        """
+        Look up LV details; the rows are None if they could not be retrieved.
+        """
+        try:
+            rows = self.lvm.get_detailed_lv_info(vg_name, lv_name)
+        except Exception as e:
+            print(f"[LvmWorker EXCEPTION] {e}")
+            rows = None
+        self.details_ready.emit(vg_name, lv_name, rows)
+
+    @pyqtSlot(str, str, str, str)
+    def create(self, vg_name, lv_name, snap_name, size):
+        self._run_op(self.lvm.create_snapshot, vg_name, lv_name, snap_name, size)
+
+    @pyqtSlot(str, str)
+    def remove(self, vg_name, snap_name):
+        self._run_op(self.lvm.remove_snapshot, vg_name, snap_name)
+
+    def _run_op(self, func, *args):
+        try:
+            success, msg = func(*args)
+            if not success:
+                print(f"[LvmWorker ERROR] {msg}")
+        except Exception as e:
+            print(f"[LvmWorker EXCEPTION] {e}")
+            success, msg = False, str(e)
+        self.op_done.emit(success, msg)
 
 
 class LoadingDialog(QDialog):
@@ -312,7 +644,7 @@ class DetailsDialog(QDialog):
 
         self.text_edit = QTextEdit(self)
         self.text_edit.setReadOnly(True)
-        self.text_edit.setFont(QFont("Monospace"))
+        self.text_edit.setFont(_mono_font())
         self.text_edit.setText(text)
         layout.addWidget(self.text_edit)
 
@@ -324,45 +656,54 @@ class DetailsDialog(QDialog):
 
         layout.addLayout(btn_layout)
 
+        self._clipboard = QApplication.clipboard()
         self.copy_btn.clicked.connect(self.copy_to_clipboard)
         self.close_btn.clicked.connect(self.close)
 
     def copy_to_clipboard(self):
-        # Copy the table to the clipboard as text (tab-separated)
-        rows = []
-        headers = [self.table.horizontalHeaderItem(i).text() for i in range(self.table.columnCount())]
-        rows.append("\t".join(headers))
-        for r in range(self.table.rowCount()):
-            row_data = []
-            for c in range(self.table.columnCount()):
-                item = self.table.item(r, c)
-                row_data.append(item.text() if item else "")
-            rows.append("\t".join(row_data))
-        text = "\n".join(rows)
-        QApplication.clipboard().setText(text)
+        # Copy the shown text to the clipboard
+        self._clipboard.setText(self.text_edit.toPlainText())
 
 class MainWindow(QWidget):
     """
     Main GUI window class for LVM Snapshot Manager.
     """
+    # Usage label texts, sizes in MiB
+    _SNAP_TPL = "Snapshot Usage: {p:.2f}% ({u:.1f} MiB / {t:.1f} MiB)"
+    _VG_TPL = "VG Usage: {p:.2f}% ({u:.1f} MiB used / {f:.1f} MiB free / {t:.1f} MiB total)"
+
+    request_lvs = pyqtSignal()
+    request_reload = pyqtSignal()
+    request_version = pyqtSignal()
+    request_create = pyqtSignal(str, str, str, str)
+    request_remove = pyqtSignal(str, str)
+    request_details = pyqtSignal(str, str)
 
     def __init__(self):
         super().__init__()
         self.lvm = LvmManager()
+        # Last LvmManager.snapshot() delivered by the worker
+        self.lv_data = {}
         self.setWindowTitle("LVM Snapshot Manager")
 
-        # Check installed LVM version and warn if newer than tested
-        tested_version = (2, 3, 30)
-        current_version = check_lvm_version()
-        if current_version is not None:
-            if current_version > tested_version:
-                QMessageBox.warning(
-                    self,
-                    "Warning",
-                    f"Detected LVM version {'.'.join(map(str, current_version))} "
-                    f"is newer than tested version 2.3.30.\n"
-                    "Some features may not work as expected."
-                )
+        # All LVM queries and snapshot operations run on this worker thread
+        self.worker_thread = QThread(self)
+        self.worker = LvmWorker(self.lvm)
+        self.worker.moveToThread(self.worker_thread)
+        queued = Qt.ConnectionType.QueuedConnection
+        self.request_lvs.connect(self.worker.list_lvs, queued)
+        self.request_reload.connect(self.worker.reload, queued)
+        self.request_version.connect(self.worker.check_version, queued)
+        self.request_create.connect(self.worker.create, queued)
+        self.request_remove.connect(self.worker.remove, queued)
+        self.request_details.connect(self.worker.details, queued)
+        self.worker.lvs_ready.connect(self.on_lvs_listed)
+        self.worker.lvs_failed.connect(self.on_lvs_failed)
+        self.worker.usage_reloaded.connect(self.on_usage_reloaded)
+        self.worker.version_ready.connect(self.on_version_checked)
+        self.worker.details_ready.connect(self.on_details_ready)
+        self.worker.op_done.connect(self.loading_finished)
+        self.worker_thread.start()
 
         # Set up main layout and widgets
         self.layout = QVBoxLayout()
@@ -430,29 +771,74 @@ class MainWindow(QWidget):
         self.create_btn.clicked.connect(self.create_snapshot)
         self.delete_btn.clicked.connect(self.delete_snapshot)
         self.mount_btn.clicked.connect(self.mount_snapshot)
-        self.lv_list.itemSelectionChanged.connect(self.update_usage)
-        self.lv_list.itemSelectionChanged.connect(self.update_buttons_state)
+        # Usage display waits for 120 ms without selection changes, e.g. while
+        # scrolling the list with arrow keys
+        self._usage_timer = QTimer(self)
+        self._usage_timer.setSingleShot(True)
+        self._usage_timer.setInterval(120)
+        self._usage_timer.timeout.connect(self.update_usage)
+        self.lv_list.itemSelectionChanged.connect(self._on_selection_changed)
 
         # Load logical volumes into list
         self.refresh_lv_list()
         self.update_buttons_state()  # Set correct state of buttons at startup
 
+        # Check installed LVM version on the worker, the warning is shown once the window is up
+        self.request_version.emit()
+
+    def on_version_checked(self, current_version):
+        """
+        Warn if installed LVM version is newer than tested.
+        """
+        tested_version = (2, 3, 30)
+        if current_version is not None:
+            if current_version > tested_version:
+                QMessageBox.warning(
+                    self,
+                    "Warning",
+                    f"Detected LVM version {'.'.join(map(str, current_version))} "
+                    f"is newer than tested version 2.3.30.\n"
+                    "Some features may not work as expected."
+                )
+
+    def closeEvent(self, event):
+        self.worker_thread.quit()
+        self.worker_thread.wait()
+        self.lvm.close()
+        super().closeEvent(event)
+
     def refresh_lv_list(self):
+        """
+        Ask the worker to reload logical volumes; the list is filled in on_lvs_listed.
+        """
+        self.request_lvs.emit()
+
+    def on_lvs_listed(self, lv_data):
         """
         Refresh the list of logical volumes shown in the GUI.
         """
+        self.lv_data = lv_data
+        # Repaint and notify selection listeners once, not for every removed/added item
+        self.lv_list.setUpdatesEnabled(False)
+        self.lv_list.blockSignals(True)
         self.lv_list.clear()
-        try:
-            self.lvs = self.lvm.list_logical_volumes()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to list logical volumes:\n{e}")
-            return
-        for vg, lv, is_snap in self.lvs:
-            item_text = f"{vg}/{lv}"
-            if is_snap:
-                item_text += " [snapshot]"
-            self.lv_list.addItem(item_text)
-        self.lv_list.update()
+        for (vg, lv), info in lv_data.items():
+            is_snap = info.is_snap
+            item = QListWidgetItem(f"{vg}/{lv}" + (" [snapshot]" if is_snap else ""))
+            # Handlers read (vg, lv, is_snap) back instead of parsing the display text
+            item.setData(Qt.ItemDataRole.UserRole, (vg, lv, is_snap))
+            self.lv_list.addItem(item)
+        self.lv_list.blockSignals(False)
+        self.lv_list.setUpdatesEnabled(True)
+        self.update_buttons_state()
+        self.update_usage()
+
+    def on_usage_reloaded(self, lv_data):
+        self.lv_data = lv_data
+        self.update_usage()
+
+    def on_lvs_failed(self, msg):
+        QMessageBox.critical(self, "Error", f"Failed to list logical volumes:\n{msg}")
 
     def create_snapshot(self):
         """
@@ -469,18 +855,16 @@ class MainWindow(QWidget):
             QMessageBox.warning(self, "Warning", "Please enter a snapshot name.")
             return
 
-        vg, lv = selected.text().split("/", 1)
-        vg = vg.strip()
-        lv = lv.split()[0]  # remove "[snapshot]" suffix if any
+        vg, lv, _ = selected.data(Qt.ItemDataRole.UserRole)
 
-        # Run create_snapshot in background thread with loading dialog
-        self.run_with_loading(self.lvm.create_snapshot, vg, lv, snap_name, size, callback=self.on_snapshot_created)
+        # Run create_snapshot on the worker thread with loading dialog
+        self.show_loading(callback=self.on_snapshot_created)
+        self.request_create.emit(vg, lv, snap_name, size)
 
     def on_snapshot_created(self, success, msg):
         if success:
             self.status_label.setText("Snapshot created successfully.")
             self.refresh_lv_list()
-            self.update_buttons_state()
         else:
             QMessageBox.critical(self, "Error", f"Failed to create snapshot:\n{msg}")
 
@@ -493,9 +877,7 @@ class MainWindow(QWidget):
             QMessageBox.warning(self, "Warning", "Please select a snapshot to delete.")
             return
 
-        vg, lv = selected.text().split("/", 1)
-        vg = vg.strip()
-        lv = lv.split()[0]
+        vg, lv, _ = selected.data(Qt.ItemDataRole.UserRole)
 
         confirm = QMessageBox.question(
             self,
@@ -507,13 +889,13 @@ class MainWindow(QWidget):
         if confirm != QMessageBox.StandardButton.Yes:
             return
 
-        self.run_with_loading(self.lvm.remove_snapshot, vg, lv, callback=self.on_snapshot_deleted)
+        self.show_loading(callback=self.on_snapshot_deleted)
+        self.request_remove.emit(vg, lv)
 
     def on_snapshot_deleted(self, success, msg):
         if success:
             self.status_label.setText("Snapshot deleted successfully.")
             self.refresh_lv_list()
-            self.update_buttons_state()
         else:
             QMessageBox.critical(self, "Error", f"Failed to delete snapshot:\n{msg}")
 
@@ -526,8 +908,7 @@ class MainWindow(QWidget):
         if not selected:
             QMessageBox.warning(self, "Warning", "Please select a snapshot to mount.")
             return
-        index = self.lv_list.currentRow()
-        vg, lv, is_snap = self.lvs[index]
+        vg, lv, is_snap = selected.data(Qt.ItemDataRole.UserRole)
 
         if not is_snap:
             QMessageBox.warning(self, "Warning", "Selected volume is not a snapshot.")
@@ -559,32 +940,43 @@ class MainWindow(QWidget):
             self.usage_label.setText("Snapshot Usage:")
             return
 
-        index = self.lv_list.currentRow()
-        vg, lv, is_snap = self.lvs[index]
+        vg, lv, is_snap = selected.data(Qt.ItemDataRole.UserRole)
+
+        # Expired data is still shown while the worker reloads it in background
+        if self.lvm.is_stale():
+            self.request_reload.emit()
 
+        # Only data delivered by the last refresh is read, no LVM call is made
+        info = self.lv_data.get((vg, lv))
         if is_snap:
-            # Show snapshot usage percent and MB info
-            used_mb, size_mb = self.lvm.get_snapshot_info(vg, lv, is_snap)
-            if used_mb is None or size_mb is None:
+            # Show snapshot usage percent and MiB info
+            if info is None or info.used is None:
                 self.usage_bar.setValue(0)
                 self.usage_label.setText("Snapshot Usage: Unknown or not a snapshot")
             else:
-                percent = (used_mb / size_mb) * 100 if size_mb else 0
-                self.usage_bar.setValue(int(percent))
-                self.usage_label.setText(f"Snapshot Usage: {percent:.2f}% ({used_mb:.1f} MB / {size_mb:.1f} MB)")
+                used, size = info.used, info.size
+                self.usage_bar.setValue(used * 100 // size if size else 0)
+                percent = used * 100 / size if size else 0
+                self.usage_label.setText(self._SNAP_TPL.format(p=percent, u=used / MIB, t=size / MIB))
         else:
             # Show volume group free/used space info if selected LV is not a snapshot
-            free_mb, size_mb = self.lvm.get_vg_free_space(vg)
-            if free_mb is None or size_mb is None:
+            if info is None or info.vg_free is None:
                 self.usage_bar.setValue(0)
                 self.usage_label.setText("VG Free Space: Unknown")
             else:
-                used_mb = size_mb - free_mb
-                percent = (used_mb / size_mb) * 100 if size_mb else 0
-                self.usage_bar.setValue(int(percent))
-                self.usage_label.setText(
-                    f"VG Usage: {percent:.2f}% ({used_mb:.1f} MB used / {free_mb:.1f} MB free / {size_mb:.1f} MB total)"
-                )
+                free, size = info.vg_free, info.vg_size
+                used = size - free
+                self.usage_bar.setValue(used * 100 // size if size else 0)
+                percent = used * 100 / size if size else 0
+                self.usage_label.setText(self._VG_TPL.format(p=percent, u=used / MIB, f=free / MIB, t=size / MIB))
+
+    def _on_selection_changed(self):
+        """
+        Single slot for itemSelectionChanged: buttons follow the selection at once,
+        usage is updated after the debounce interval.
+        """
+        self.update_buttons_state()
+        self._usage_timer.start()
 
     def update_buttons_state(self):
         """
@@ -596,24 +988,27 @@ class MainWindow(QWidget):
             self.delete_btn.setEnabled(False)
             self.mount_btn.setEnabled(False)
             return
-        index = self.lv_list.currentRow()
-        _, _, is_snap = self.lvs[index]
+        _, _, is_snap = selected.data(Qt.ItemDataRole.UserRole)
         self.delete_btn.setEnabled(is_snap)
         self.mount_btn.setEnabled(is_snap)
 
     def run_with_loading(self, func, *args, callback=None):
         """
-        Runs a blocking function func(*args) in a separate thread with
+        Runs a blocking function func(*args) on the global thread pool with
         modal loading dialog. Calls callback(success, msg) when done.
         """
+        # Keep a reference so the signals object outlives the pooled run
+        self._task = LvmTask(func, *args)
+        self._task.signals.finished_signal.connect(self.loading_finished)
+        self.show_loading(callback=callback)
+        QThreadPool.globalInstance().start(self._task)
+
+    def show_loading(self, callback=None):
+        """
+        Show modal loading dialog until loading_finished is called.
+        """
         self.loading_dialog = LoadingDialog(self)
-        self.thread = CommandThread(func, *args)
-        self.thread.finished_signal.connect(self.loading_finished)
-        if callback:
-            self._callback = callback
-        else:
-            self._callback = None
-        self.thread.start()
+        self._callback = callback
         self.loading_dialog.show()
 
     def loading_finished(self, success, msg):
@@ -641,24 +1036,26 @@ class MainWindow(QWidget):
         item = self.lv_list.itemAt(position)
         if item is None:
             return
-        index = self.lv_list.row(item)
-        vg, lv, _ = self.lvs[index]
+        vg, lv, _ = item.data(Qt.ItemDataRole.UserRole)
 
         menu = QMenu()
         details_action = menu.addAction("Show LV details")
         action = menu.exec(self.lv_list.mapToGlobal(position))
 
         if action == details_action:
-            info = self.lvm.get_detailed_lv_info(vg, lv)
-            if info is None:
-                QMessageBox.critical(self, "Error", "The volume details could not be retrieved.")
-                return
+            # The lvs query runs on the worker, on_details_ready shows the result
+            self.request_details.emit(vg, lv)
+
+    def on_details_ready(self, vg, lv, rows):
+        if rows is None:
+            QMessageBox.critical(self, "Error", "The volume details could not be retrieved.")
+            return
 
-            # Automatically copy to clipboard (optional)
-            QApplication.clipboard().setText(info)
+        # Automatically copy to clipboard (optional)
+        QApplication.clipboard().setText("\n".join("\t".join(row) for row in rows))
 
-            dlg = DetailsTableDialog(f"Details for {vg}/{lv}", info, self)
-            dlg.exec()
+        dlg = DetailsTableDialog(f"Details for {vg}/{lv}", rows, self)
+        dlg.exec()
 
 # We need to import QInputDialog used in mount_snapshot
 from PyQt6.QtWidgets import QInputDialog